@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : BatchCalculator.py
+# Project Name : Mortgage-Loan-Calculator
+# Author       : Yogyui (SeungHee Lee)
+# Organization :
+# Description  : 다수 대출의 상환 스케줄 일괄 계산 (numpy 벡터 연산)
+# [Revision History]
+# >> 2026.10.19 - First Commit
+# -------------------------------------------------------------------------------------------------------------------- #
+import math
+import numpy as np
+import pandas as pd
+from typing import Iterator, Tuple
+from Calculator import RepaymentType, RoundType
+
+
+def _round_array(values: np.ndarray, round_floating: np.ndarray) -> np.ndarray:
+    # 대출별 소수점 처리 방식 적용 (반올림 / 올림 / 버림), 한가지 방식만 사용된 경우 해당 연산만 수행
+    is_off = round_floating == RoundType.Off
+    is_up = round_floating == RoundType.Up
+    if is_off.all():
+        result = np.round(values)
+    elif is_up.all():
+        result = np.ceil(values)
+    elif not (is_off.any() or is_up.any()):
+        result = np.trunc(values)
+    else:
+        result = np.where(is_off, np.round(values), np.where(is_up, np.ceil(values), np.trunc(values)))
+    return result.astype(np.int64)
+
+
+def _pow_array(base: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    # MortgageLoanCalculator 와 동일한 결과를 얻기 위해 math.pow 사용 (중복 조합은 한번만 계산)
+    if len(base) == 0:
+        return np.zeros(0, dtype=np.float64)
+    pairs, inverse = np.unique(np.column_stack((base, exponent)), axis=0, return_inverse=True)
+    powed = np.fromiter((math.pow(b, e) for b, e in pairs), dtype=np.float64, count=len(pairs))
+    return powed[inverse.reshape(-1)]
+
+
+def calculable_mask(interest_rate_percentage, period_month, grace_period_month, repayment_type) -> np.ndarray:
+    # 0으로 나누기 없이 계산 가능한 대출 여부 (원리금균등: (1 + 월이율)^(기간 - 거치) = 1, 원금균등: 기간 = 거치 이면 불가)
+    arrays = np.broadcast_arrays(
+        np.asarray(interest_rate_percentage, dtype=np.float64),
+        np.asarray(period_month, dtype=np.int64),
+        np.asarray(grace_period_month, dtype=np.int64),
+        np.asarray(repayment_type, dtype=np.int64)
+    )
+    rate_percentage, period, grace, repayment = [np.atleast_1d(x) for x in arrays]
+    is_epi = repayment == RepaymentType.EqualPrincipalInterest
+    is_ep = repayment == RepaymentType.EqualPrincipal
+    result = ~(is_ep & (period == grace))
+    temp = _pow_array(1 + rate_percentage[is_epi] / 100 / 12, (period - grace)[is_epi])
+    result[is_epi] = temp - 1 != 0
+    return result
+
+
+def iterate_batch_schedule(
+        principal, interest_rate_percentage, period_month, grace_period_month, repayment_type, round_floating
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    대출 N건의 상환 스케줄을 회차 단위로 계산
+    각 인자는 길이 N의 배열 (또는 스칼라)
+    회차 i (0부터 시작) 마다 (i, 상환중인 대출 인덱스, 납입이자, 납입원금, 대출잔금) 반환
+    대출 기간 내림차순으로 정렬해두고 상환이 끝난 대출은 계산에서 제외
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(principal, dtype=np.int64),
+        np.asarray(interest_rate_percentage, dtype=np.float64),
+        np.asarray(period_month, dtype=np.int64),
+        np.asarray(grace_period_month, dtype=np.int64),
+        np.asarray(repayment_type, dtype=np.int64),
+        np.asarray(round_floating, dtype=np.int64)
+    )
+    principal, rate_percentage, period, grace, repayment, round_type = [np.atleast_1d(x) for x in arrays]
+    interest_rate_month = rate_percentage / 100 / 12
+    is_epi = repayment == RepaymentType.EqualPrincipalInterest
+    is_ep = repayment == RepaymentType.EqualPrincipal
+    is_bullet = ~(is_epi | is_ep)
+
+    # 월 균등 상환액(원리금균등), 월 상환원금(원금균등), 월 납입이자(만기일시)
+    fixed = np.zeros(len(principal), dtype=np.int64)
+    if is_epi.any():
+        rate = interest_rate_month[is_epi]
+        temp = _pow_array(1 + rate, (period - grace)[is_epi])
+        if (temp - 1 == 0).any():
+            raise ZeroDivisionError('float division by zero')
+        fixed[is_epi] = np.round(principal[is_epi] * rate * temp / (temp - 1)).astype(np.int64)
+    if is_ep.any():
+        div = (period - grace)[is_ep]
+        if (div == 0).any():
+            raise ZeroDivisionError('division by zero')
+        fixed[is_ep] = _round_array(principal[is_ep] / div, round_type[is_ep])
+    if is_bullet.any():
+        fixed[is_bullet] = _round_array(principal[is_bullet] * interest_rate_month[is_bullet], round_type[is_bullet])
+
+    # 대출 기간 내림차순 정렬 -> i 회차에 상환중인 대출은 항상 앞쪽 count 건
+    order = np.argsort(-period, kind='stable')
+    period, grace, rate_month, round_type = period[order], grace[order], interest_rate_month[order], round_type[order]
+    is_epi, is_bullet, fixed = is_epi[order], is_bullet[order], fixed[order]
+    grace = np.where(is_bullet, 0, grace)  # 만기일시상환은 거치기간 없음
+    scheduled = np.where(is_bullet, 0, fixed)
+    active_count = np.searchsorted(-period, -np.arange(int(period.max(initial=0))), side='left')
+    residual = principal[order]
+    has_bullet = bool(is_bullet.any())
+    has_epi = bool(is_epi.any())
+    for i in range(len(active_count)):
+        count = active_count[i]
+        residual = residual[:count]
+        interest = _round_array(residual * rate_month[:count], round_type[:count])
+        if has_bullet:
+            interest = np.where(is_bullet[:count], fixed[:count], interest)
+        repaid = scheduled[:count]
+        if has_epi:
+            repaid = np.where(is_epi[:count], repaid - interest, repaid)
+        repaid = np.where(period[:count] == i + 1, residual, repaid)
+        repaid = np.where(grace[:count] > i, 0, repaid)
+        residual = residual - repaid
+        yield i, order[:count], interest, repaid, residual
+
+
+def calculate_batch_schedule(
+        principal, interest_rate_percentage, period_month, grace_period_month, repayment_type, round_floating
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    대출 N건의 상환 스케줄을 (N, 최대 대출 기간) 크기의 납입이자, 납입원금, 대출잔금 배열로 반환
+    상환이 끝난 이후 회차의 값은 모두 0
+    """
+    count = np.broadcast(principal, interest_rate_percentage, period_month, grace_period_month,
+                         repayment_type, round_floating).size
+    period = np.broadcast_to(np.asarray(period_month, dtype=np.int64), (count, ))
+    month_count = int(period.max(initial=0))
+    arr_interest = np.zeros((count, month_count), dtype=np.int64)
+    arr_principal = np.zeros((count, month_count), dtype=np.int64)
+    arr_residual = np.zeros((count, month_count), dtype=np.int64)
+    for i, index, interest, repaid, residual in iterate_batch_schedule(
+            principal, interest_rate_percentage, period_month, grace_period_month, repayment_type, round_floating):
+        arr_interest[index, i] = interest
+        arr_principal[index, i] = repaid
+        arr_residual[index, i] = residual
+    return arr_interest, arr_principal, arr_residual
+
+
+def schedule_to_dataframe(interest: np.ndarray, principal: np.ndarray, residual: np.ndarray) -> pd.DataFrame:
+    # 대출 1건의 회차별 배열을 MortgageLoanCalculator.calculate 결과와 같은 형식으로 변환
+    df_result = pd.DataFrame({
+        '납입회차': np.arange(1, len(interest) + 1, dtype=np.int64),
+        '월상환금': interest + principal,
+        '납입이자': interest,
+        '납입이자계': np.cumsum(interest),
+        '납입원금': principal,
+        '납입원금계': np.cumsum(principal),
+        '대출잔금': residual
+    })
+    return df_result
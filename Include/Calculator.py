@@ -6,15 +6,19 @@
 # Description  : 주택담보대출 상환액 계산 알고리즘 구현
 # [Revision History]
 # >> 2022.04.20 - First Commit
+# >> 2026.10.19 - 대출 실행일 및 납입일 추가, 납입일자 포함 상환 스케줄 출력
+# >> 2026.10.19 - 불변 대출 조건(LoanTerms) 및 상태 없는 계산 함수 분리
 # -------------------------------------------------------------------------------------------------------------------- #
 import os
 import time
 import math
+import datetime
 import numpy as np
 import pandas as pd
+from typing import Union
 from enum import IntEnum, unique, auto
 import xml.etree.ElementTree as ET
-from Common import ensurePathExist, writeXmlFile
+from Common import ensurePathExist, writeXmlFile, payment_date
 
 
 @unique
@@ -32,6 +36,209 @@ class RoundType(IntEnum):
     Down = auto()  # 버림
 
 
+class LoanTerms:
+    """
+    대출 조건 (불변 객체, 해시 가능)
+    생성 후 값을 바꿀 수 없으므로 스레드 간 공유 및 캐시 키로 사용 가능, 변경은 replace() 로 새 객체 생성
+    """
+    __slots__ = (
+        'principal', 'interest_rate_percentage', 'period_month', 'grace_period_month',
+        'repayment_type', 'round_floating', 'start_date', 'payment_day'
+    )
+    principal: int  # 대출 원금
+    interest_rate_percentage: float  # 대출 금리 (년, 퍼센트)
+    period_month: int  # 대출 기간 (개월)
+    grace_period_month: int  # 이자 거치 기간 (개월)
+    repayment_type: RepaymentType  # 대출 상환 방식
+    round_floating: RoundType  # 소수점 처리 방식
+    start_date: Union[datetime.date, None]  # 대출 실행일
+    payment_day: Union[int, None]  # 매월 납입일 (None: 대출 실행일과 같은 날)
+
+    def __init__(
+            self,
+            principal: int = 100000000,
+            interest_rate_percentage: float = 4.,
+            period_month: int = 360,
+            grace_period_month: int = 0,
+            repayment_type: RepaymentType = RepaymentType.EqualPrincipalInterest,
+            round_floating: RoundType = RoundType.Off,
+            start_date: datetime.date = None,
+            payment_day: int = None
+    ):
+        object.__setattr__(self, 'principal', int(principal))
+        object.__setattr__(self, 'interest_rate_percentage', float(interest_rate_percentage))
+        object.__setattr__(self, 'period_month', int(period_month))
+        object.__setattr__(self, 'grace_period_month', int(grace_period_month))
+        object.__setattr__(self, 'repayment_type', RepaymentType(repayment_type))
+        object.__setattr__(self, 'round_floating', RoundType(round_floating))
+        object.__setattr__(self, 'start_date', start_date)
+        if payment_day is not None and not 1 <= int(payment_day) <= 31:
+            raise ValueError('payment_day must be in [1, 31]')
+        object.__setattr__(self, 'payment_day', None if payment_day is None else int(payment_day))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("'LoanTerms' object is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError("'LoanTerms' object is immutable")
+
+    def astuple(self) -> tuple:
+        return tuple(getattr(self, x) for x in self.__slots__)
+
+    def replace(self, **kwargs) -> 'LoanTerms':
+        values = dict(zip(self.__slots__, self.astuple()))
+        values.update(kwargs)
+        return LoanTerms(**values)
+
+    def __eq__(self, other):
+        if not isinstance(other, LoanTerms):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    def __hash__(self):
+        return hash(self.astuple())
+
+    def __repr__(self):
+        return 'LoanTerms({})'.format(', '.join('{}={!r}'.format(x, getattr(self, x)) for x in self.__slots__))
+
+    def __reduce__(self):
+        return LoanTerms, self.astuple()
+
+
+def calculate_schedule(terms: LoanTerms) -> pd.DataFrame:
+    """
+    대출 조건(LoanTerms)으로 회차별 상환 스케줄 계산
+    내부 상태를 읽거나 쓰지 않으므로 여러 스레드/태스크에서 동시에 호출 가능
+    """
+    lst_sequence = []  # 납입회차
+    lst_repay_total = []  # 월 상환금
+    lst_repay_principal = []  # 월 납입원금
+    lst_repay_interest = []  # 월 납입이자
+    lst_principal_sum = []  # 납입원금 합
+    lst_interest_sum = []  # 납입이자 합
+    lst_residual = []  # 월 잔금
+
+    interest_rate_month = terms.interest_rate_percentage / 100 / 12
+    sequence = 1  # 회차
+    residual = terms.principal  # 잔금
+    principal_sum = 0  # 원금 납입계
+    interest_sum = 0  # 이자 납입계
+
+    if terms.repayment_type == RepaymentType.EqualPrincipalInterest:  # 원리금균등상환
+        # 월 균등 상환액 산출 (https://meaningone.tistory.com/632)
+        temp = math.pow(1 + interest_rate_month, terms.period_month - terms.grace_period_month)
+        repayment_month = round(terms.principal * interest_rate_month * temp / (temp - 1))  # 소수점 반올림
+        # 이터레이션
+        for i in range(terms.period_month):
+            interest = residual * interest_rate_month
+            if terms.round_floating == RoundType.Off:  # 반올림
+                interest = int(np.round(interest))
+            elif terms.round_floating == RoundType.Up:  # 올림
+                interest = int(np.ceil(interest))
+            else:  # 버림
+                interest = int(np.trunc(interest))
+            interest_sum += interest
+            if i in range(terms.grace_period_month):  # 이자거치기간일 경우
+                principal = 0
+            elif i == terms.period_month - 1:
+                principal = residual
+                residual = 0
+            else:
+                principal = repayment_month - interest
+                residual -= principal
+            principal_sum += principal
+
+            lst_repay_interest.append(interest)
+            lst_repay_principal.append(principal)
+            lst_principal_sum.append(principal_sum)
+            lst_interest_sum.append(interest_sum)
+            lst_repay_total.append(interest + principal)
+            lst_residual.append(residual)
+            lst_sequence.append(sequence)
+            sequence += 1
+    elif terms.repayment_type == RepaymentType.EqualPrincipal:  # 원금균등상환
+        # 이터레이션
+        principal_div = terms.principal / (terms.period_month - terms.grace_period_month)
+        if terms.round_floating == RoundType.Off:  # 반올림
+            principal_div = int(np.round(principal_div))
+        elif terms.round_floating == RoundType.Up:  # 올림
+            principal_div = int(np.ceil(principal_div))
+        else:  # 버림
+            principal_div = int(np.trunc(principal_div))
+        for i in range(terms.period_month):
+            interest = residual * interest_rate_month
+            if terms.round_floating == RoundType.Off:  # 반올림
+                interest = int(np.round(interest))
+            elif terms.round_floating == RoundType.Up:  # 올림
+                interest = int(np.ceil(interest))
+            else:  # 버림
+                interest = int(np.trunc(interest))
+            interest_sum += interest
+            if i in range(terms.grace_period_month):  # 이자거치기간일 경우
+                principal = 0
+            elif i == terms.period_month - 1:
+                principal = residual
+                residual = 0
+            else:
+                principal = principal_div
+                residual -= principal
+            principal_sum += principal
+
+            lst_repay_interest.append(interest)
+            lst_repay_principal.append(principal)
+            lst_principal_sum.append(principal_sum)
+            lst_interest_sum.append(interest_sum)
+            lst_repay_total.append(interest + principal)
+            lst_residual.append(residual)
+            lst_sequence.append(sequence)
+            sequence += 1
+    elif terms.repayment_type == RepaymentType.Bullet:  # 만기일시상환
+        # 이터레이션
+        interest = residual * interest_rate_month
+        if terms.round_floating == RoundType.Off:  # 반올림
+            interest = int(np.round(interest))
+        elif terms.round_floating == RoundType.Up:  # 올림
+            interest = int(np.ceil(interest))
+        else:  # 버림
+            interest = int(np.trunc(interest))
+        for i in range(terms.period_month):
+            interest_sum += interest
+            if i == terms.period_month - 1:
+                principal = residual
+                residual = 0
+            else:
+                principal = 0
+                residual -= principal
+            principal_sum += principal
+
+            lst_repay_interest.append(interest)
+            lst_repay_principal.append(principal)
+            lst_principal_sum.append(principal_sum)
+            lst_interest_sum.append(interest_sum)
+            lst_repay_total.append(interest + principal)
+            lst_residual.append(residual)
+            lst_sequence.append(sequence)
+            sequence += 1
+
+    df_result = pd.DataFrame(
+        (lst_sequence, lst_repay_total,
+         lst_repay_interest, lst_interest_sum,
+         lst_repay_principal, lst_principal_sum, lst_residual)
+    ).T
+    df_result.columns = ['납입회차', '월상환금', '납입이자', '납입이자계', '납입원금', '납입원금계', '대출잔금']
+    return df_result
+
+
+def calculate_dated_schedule(terms: LoanTerms) -> pd.DataFrame:
+    # 납입일 컬럼이 포함된 상환 스케줄 (start_date 미지정 시 납입일 없이 반환)
+    df_result = calculate_schedule(terms)
+    if terms.start_date is not None:
+        payment_day = terms.start_date.day if terms.payment_day is None else terms.payment_day
+        lst_date = [payment_date(terms.start_date, x, payment_day) for x in df_result['납입회차']]
+        df_result.insert(1, '납입일', lst_date)
+    return df_result
+
+
 class MortgageLoanCalculator:
     _principal: int  # 대출 원금
     _interest_rate_percentage: float  # 대출 금리 (년, 퍼센트)
@@ -39,6 +246,8 @@ class MortgageLoanCalculator:
     _grace_period_month: int  # 이자 거치 기간 (개월)
     _repayment_type: RepaymentType  # 대출 상환 방식
     _round_floating: RoundType  # 소수점 처리 방식
+    _start_date: datetime.date  # 대출 실행일
+    _payment_day: int  # 매월 납입일 (1 ~ 31)
 
     def __init__(self):
         self._principal = 100000000
@@ -47,136 +256,23 @@ class MortgageLoanCalculator:
         self._grace_period_month = 0
         self._repayment_type = RepaymentType.EqualPrincipalInterest
         self._round_floating = RoundType.Off
+        self._start_date = datetime.date.today()
+        self._payment_day = self._start_date.day
         curpath = os.path.dirname(os.path.abspath(__file__))
         self._config_xml_path = os.path.join(os.path.dirname(curpath), 'Config/config.xml')
         self.loadConfig()
 
     def calculate(self) -> pd.DataFrame:
         tm_start = time.perf_counter()
-
-        lst_sequence = []  # 납입회차
-        lst_repay_total = []  # 월 상환금
-        lst_repay_principal = []  # 월 납입원금
-        lst_repay_interest = []  # 월 납입이자
-        lst_principal_sum = []  # 납입원금 합
-        lst_interest_sum = []  # 납입이자 합
-        lst_residual = []  # 월 잔금
-
-        interest_rate_month = self._interest_rate_percentage / 100 / 12
-        sequence = 1  # 회차
-        residual = self._principal  # 잔금
-        principal_sum = 0  # 원금 납입계
-        interest_sum = 0  # 이자 납입계
-
-        if self._repayment_type == RepaymentType.EqualPrincipalInterest:  # 원리금균등상환
+        terms = self.terms
+        df_result = calculate_schedule(terms)
+        if terms.repayment_type == RepaymentType.EqualPrincipalInterest:
             print("[원리금 균등 상환]")
-            # 월 균등 상환액 산출 (https://meaningone.tistory.com/632)
-            temp = math.pow(1 + interest_rate_month, self._period_month - self._grace_period_month)
-            repayment_month = round(self._principal * interest_rate_month * temp / (temp - 1))  # 소수점 반올림
-            print("월 상환금액: {:,}".format(repayment_month))
-            # 이터레이션
-            for i in range(self._period_month):
-                interest = residual * interest_rate_month
-                if self._round_floating == RoundType.Off:  # 반올림
-                    interest = int(np.round(interest))
-                elif self._round_floating == RoundType.Up:  # 올림
-                    interest = int(np.ceil(interest))
-                else:  # 버림
-                    interest = int(np.trunc(interest))
-                interest_sum += interest
-                if i in range(self._grace_period_month):  # 이자거치기간일 경우
-                    principal = 0
-                elif i == self._period_month - 1:
-                    principal = residual
-                    residual = 0
-                else:
-                    principal = repayment_month - interest
-                    residual -= principal
-                principal_sum += principal
-
-                lst_repay_interest.append(interest)
-                lst_repay_principal.append(principal)
-                lst_principal_sum.append(principal_sum)
-                lst_interest_sum.append(interest_sum)
-                lst_repay_total.append(interest + principal)
-                lst_residual.append(residual)
-                lst_sequence.append(sequence)
-                sequence += 1
-        elif self._repayment_type == RepaymentType.EqualPrincipal:  # 원금균등상환
+        elif terms.repayment_type == RepaymentType.EqualPrincipal:
             print("[원금 균등 상환]")
-            # 이터레이션
-            principal_div = self._principal / (self._period_month - self._grace_period_month)
-            if self._round_floating == RoundType.Off:  # 반올림
-                principal_div = int(np.round(principal_div))
-            elif self._round_floating == RoundType.Up:  # 올림
-                principal_div = int(np.ceil(principal_div))
-            else:  # 버림
-                principal_div = int(np.trunc(principal_div))
-            print("월 상환원금: {:,}".format(principal_div))
-            for i in range(self._period_month):
-                interest = residual * interest_rate_month
-                if self._round_floating == RoundType.Off:  # 반올림
-                    interest = int(np.round(interest))
-                elif self._round_floating == RoundType.Up:  # 올림
-                    interest = int(np.ceil(interest))
-                else:  # 버림
-                    interest = int(np.trunc(interest))
-                interest_sum += interest
-                if i in range(self._grace_period_month):  # 이자거치기간일 경우
-                    principal = 0
-                elif i == self._period_month - 1:
-                    principal = residual
-                    residual = 0
-                else:
-                    principal = principal_div
-                    residual -= principal
-                principal_sum += principal
-
-                lst_repay_interest.append(interest)
-                lst_repay_principal.append(principal)
-                lst_principal_sum.append(principal_sum)
-                lst_interest_sum.append(interest_sum)
-                lst_repay_total.append(interest + principal)
-                lst_residual.append(residual)
-                lst_sequence.append(sequence)
-                sequence += 1
-        elif self._repayment_type == RepaymentType.Bullet:  # 만기일시상환
+        else:
             print("[만기 일시 상환]")
-            # 이터레이션
-            interest = residual * interest_rate_month
-            if self._round_floating == RoundType.Off:  # 반올림
-                interest = int(np.round(interest))
-            elif self._round_floating == RoundType.Up:  # 올림
-                interest = int(np.ceil(interest))
-            else:  # 버림
-                interest = int(np.trunc(interest))
-            print("월 납입이자: {:,}".format(interest))
-            for i in range(self._period_month):
-                interest_sum += interest
-                if i == self._period_month - 1:
-                    principal = residual
-                    residual = 0
-                else:
-                    principal = 0
-                    residual -= principal
-                principal_sum += principal
-
-                lst_repay_interest.append(interest)
-                lst_repay_principal.append(principal)
-                lst_principal_sum.append(principal_sum)
-                lst_interest_sum.append(interest_sum)
-                lst_repay_total.append(interest + principal)
-                lst_residual.append(residual)
-                lst_sequence.append(sequence)
-                sequence += 1
-
-        df_result = pd.DataFrame(
-            (lst_sequence, lst_repay_total,
-             lst_repay_interest, lst_interest_sum,
-             lst_repay_principal, lst_principal_sum, lst_residual)
-        ).T
-        print("총 납입이자: {:,}".format(lst_interest_sum[-1]))
-        df_result.columns = ['납입회차', '월상환금', '납입이자', '납입이자계', '납입원금', '납입원금계', '대출잔금']
+        print("총 납입이자: {:,}".format(df_result['납입이자계'].iloc[-1]))
 
         elapsed = time.perf_counter() - tm_start
         print(f"계산 시간: {elapsed * 1000} msec")
@@ -184,6 +280,11 @@ class MortgageLoanCalculator:
         self.saveConfig()
         return df_result
 
+    def calculateDated(self) -> pd.DataFrame:
+        df_result = calculate_dated_schedule(self.terms)
+        self.saveConfig()
+        return df_result
+
     def onValueChanged(self):
         pass
 
@@ -224,6 +325,22 @@ class MortgageLoanCalculator:
                 except Exception:
                     pass
 
+            node = root.find('start_date')
+            if node is not None:
+                try:
+                    self._start_date = datetime.date.fromisoformat(node.text)
+                except Exception:
+                    pass
+
+            node = root.find('payment_day')
+            if node is not None:
+                try:
+                    value = int(node.text)
+                    if 1 <= value <= 31:
+                        self._payment_day = value
+                except Exception:
+                    pass
+
     def saveConfig(self):
         if os.path.isfile(self._config_xml_path):
             try:
@@ -269,6 +386,18 @@ class MortgageLoanCalculator:
             root.append(node)
         node.text = str(self._round_floating.value)
 
+        node = root.find('start_date')
+        if node is None:
+            node = ET.Element('start_date')
+            root.append(node)
+        node.text = self._start_date.isoformat()
+
+        node = root.find('payment_day')
+        if node is None:
+            node = ET.Element('payment_day')
+            root.append(node)
+        node.text = str(self._payment_day)
+
         ensurePathExist(os.path.dirname(self._config_xml_path))
         writeXmlFile(root, self._config_xml_path)
 
@@ -325,3 +454,44 @@ class MortgageLoanCalculator:
     def round_floating(self, value: RoundType):
         self._round_floating = value
         self.onValueChanged()
+
+    @property
+    def start_date(self) -> datetime.date:
+        return self._start_date
+
+    @start_date.setter
+    def start_date(self, value: datetime.date):
+        self._start_date = value
+        self.onValueChanged()
+
+    @property
+    def payment_day(self) -> int:
+        return self._payment_day
+
+    @payment_day.setter
+    def payment_day(self, value: int):
+        if not 1 <= value <= 31:
+            raise ValueError('payment_day must be in [1, 31]')
+        self._payment_day = value
+        self.onValueChanged()
+
+    @property
+    def terms(self) -> LoanTerms:
+        # 현재 조건의 스냅샷 (이후 속성 변경과 무관)
+        return LoanTerms(
+            self._principal, self._interest_rate_percentage, self._period_month, self._grace_period_month,
+            self._repayment_type, self._round_floating, self._start_date, self._payment_day
+        )
+
+    @terms.setter
+    def terms(self, value: LoanTerms):
+        self._principal = value.principal
+        self._interest_rate_percentage = value.interest_rate_percentage
+        self._period_month = value.period_month
+        self._grace_period_month = value.grace_period_month
+        self._repayment_type = value.repayment_type
+        self._round_floating = value.round_floating
+        if value.start_date is not None:
+            self._start_date = value.start_date
+        self._payment_day = self._start_date.day if value.payment_day is None else value.payment_day
+        self.onValueChanged()
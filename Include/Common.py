@@ -1,5 +1,7 @@
 import os
 import _io
+import calendar
+import datetime
 import xml.etree.ElementTree as ElementTree
 
 
@@ -75,3 +77,11 @@ def money_string_to_readable_text(value: int):
         result += '{:,}'.format(v)
 
     return result.strip()
+
+
+def payment_date(start_date: datetime.date, sequence: int, payment_day: int) -> datetime.date:
+    # 대출 실행월 다음 달부터 매월 납입일에 상환 (납입일이 말일보다 크면 말일로 조정)
+    index = start_date.year * 12 + start_date.month - 1 + sequence
+    year, month = index // 12, index % 12 + 1
+    day = min(payment_day, calendar.monthrange(year, month)[1])
+    return datetime.date(year, month, day)
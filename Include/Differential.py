@@ -0,0 +1,199 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : Differential.py
+# Project Name : Mortgage-Loan-Calculator
+# Author       : Yogyui (SeungHee Lee)
+# Organization :
+# Description  : 기준 구현(Reference.py)과 고속 계산 엔진의 차분 검증 (무작위 대출 조건 생성)
+# [Revision History]
+# >> 2026.10.19 - First Commit
+# -------------------------------------------------------------------------------------------------------------------- #
+import time
+import random
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Tuple, Union
+from Calculator import RepaymentType, RoundType, LoanTerms, calculate_schedule
+from Reference import reference_schedule
+from BatchCalculator import calculate_batch_schedule, calculable_mask, schedule_to_dataframe
+
+# (원금, 연이자율(%), 대출기간(개월), 거치기간(개월), 상환방식, 소수점 처리)
+LoanCase = Tuple[int, float, int, int, RepaymentType, RoundType]
+Result = Union[pd.DataFrame, Exception]
+
+_engines: Dict[str, Tuple[Callable, bool]] = dict()
+
+
+def register_engine(name: str, func: Callable, batch: bool = False):
+    """
+    검증 대상 엔진 등록
+    batch=False: func(*case) -> DataFrame (대출 1건)
+    batch=True: func(cases) -> [DataFrame 또는 Exception, ...] (대출 N건 일괄)
+    """
+    _engines[name] = (func, batch)
+
+
+def registered_engines() -> List[str]:
+    return list(_engines.keys())
+
+
+def generate_cases(count: int, seed: int = 0) -> List[LoanCase]:
+    # 상환방식 x 소수점 처리 조합을 돌아가며 경계값 위주로 대출 조건 생성
+    rng = random.Random(seed)
+    combinations = list(itertools.product(RepaymentType, RoundType))
+    cases = []
+    for n in range(count):
+        repayment_type, round_floating = combinations[n % len(combinations)]
+        principal = rng.choice([
+            rng.randint(1, 1000),
+            rng.randint(1, 10 ** 8),
+            rng.randint(10 ** 7, 2 * 10 ** 9),
+            rng.randint(1, 10 ** 11)
+        ])
+        interest = rng.choice([0., 0.01, 4., 4.5, 100., round(rng.uniform(0, 20), 2), rng.uniform(0, 30)])
+        period = rng.choice([
+            0, rng.randint(-12, -1), 1, 2, 11, 12, 13, 360, rng.randint(1, 480), rng.randint(1, 40) * 12
+        ])
+        grace = rng.choice([0, 0, period - 1, period, period + rng.randint(1, 12), rng.randint(0, max(period, 0))])
+        cases.append((principal, interest, period, max(grace, 0), repayment_type, round_floating))
+    return cases
+
+
+def run_reference(case: LoanCase) -> Result:
+    try:
+        return reference_schedule(*case)
+    except Exception as e:
+        return e
+
+
+def compare_result(expected: Result, actual: Result) -> Union[str, None]:
+    # 일치하면 None, 불일치하면 원인 설명 반환
+    if isinstance(expected, Exception) or isinstance(actual, Exception):
+        if type(expected) is type(actual):
+            return None
+        return 'exception mismatch: expected {!r}, actual {!r}'.format(expected, actual)
+    if list(expected.columns) != list(actual.columns):
+        return 'column mismatch: {} != {}'.format(list(expected.columns), list(actual.columns))
+    if len(expected) != len(actual):
+        return 'length mismatch: {} != {}'.format(len(expected), len(actual))
+    for column in expected.columns:
+        lhs, rhs = expected[column].values, actual[column].values
+        diff = np.flatnonzero(lhs != rhs)
+        if len(diff) > 0:
+            row = diff[0]
+            return "'{}' mismatch at row {}: expected {}, actual {}".format(column, row, lhs[row], rhs[row])
+    return None
+
+
+def run_engine(name: str, cases: List[LoanCase]) -> List[Result]:
+    func, batch = _engines[name]
+    if batch:
+        return func(cases)
+    results = []
+    for case in cases:
+        try:
+            results.append(func(*case))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def shrink_case(name: str, case: LoanCase) -> LoanCase:
+    # 불일치가 유지되는 범위에서 원금/기간/거치기간을 줄여 최소 재현 조건 탐색
+    def fails(c: LoanCase) -> bool:
+        return compare_result(run_reference(c), run_engine(name, [c])[0]) is not None
+
+    current = case
+    shrinking = True
+    while shrinking:
+        shrinking = False
+        principal, interest, period, grace, repayment_type, round_floating = current
+        period_half = int(period / 2)  # 0 방향으로 축소 (음수 기간 포함)
+        period_step = period - 1 if period > 0 else period + 1 if period < 0 else period
+        candidates = [
+            (principal // 2, interest, period, grace, repayment_type, round_floating),
+            (principal, interest, period_half, max(min(grace, period_half), 0), repayment_type, round_floating),
+            (principal, interest, period_step, max(min(grace, period_step), 0), repayment_type, round_floating),
+            (principal, interest, period, grace // 2, repayment_type, round_floating),
+            (principal, round(interest, 2), period, grace, repayment_type, round_floating)
+        ]
+        for candidate in candidates:
+            if candidate != current and candidate[0] > 0 and fails(candidate):
+                current = candidate
+                shrinking = True
+                break
+    return current
+
+
+def run_differential(count: int = 1000, seed: int = 0, engines: List[str] = None) -> pd.DataFrame:
+    """
+    무작위 대출 조건 count 건에 대해 기준 구현과 등록된 엔진의 결과를 컬럼 단위로 비교
+    엔진별 (검증 건수, 불일치 건수, 기준 구현 소요시간, 엔진 소요시간, 속도 향상 배율) 반환
+    """
+    cases = generate_cases(count, seed)
+    tm_start = time.perf_counter()
+    expected = [run_reference(x) for x in cases]
+    elapsed_reference = time.perf_counter() - tm_start
+
+    lst_report = []
+    for name in (registered_engines() if engines is None else engines):
+        tm_start = time.perf_counter()
+        actual = run_engine(name, cases)
+        elapsed = time.perf_counter() - tm_start
+        mismatch = 0
+        for case, lhs, rhs in zip(cases, expected, actual):
+            message = compare_result(lhs, rhs)
+            if message is not None:
+                if mismatch == 0:
+                    print("[{}] {} / case: {} / shrunk: {}".format(name, message, case, shrink_case(name, case)))
+                mismatch += 1
+        lst_report.append((name, count, mismatch, elapsed_reference, elapsed, elapsed_reference / elapsed))
+
+    df_report = pd.DataFrame(
+        lst_report, columns=['engine', 'cases', 'mismatch', 'reference_sec', 'engine_sec', 'speedup']
+    )
+    return df_report
+
+
+def _batch_engine(cases: List[LoanCase]) -> List[Result]:
+    # 계산 가능한 조건은 한번에 계산, 0으로 나누기가 발생하는 조건만 1건씩 계산 (기준 구현과 같은 예외 발생)
+    columns = [np.array([x[k] for x in cases], dtype=np.float64 if k == 1 else np.int64) for k in range(6)]
+    valid = calculable_mask(columns[1], columns[2], columns[3], columns[4])
+    results: List[Result] = [None] * len(cases)
+    index = np.flatnonzero(valid)
+    arr_interest, arr_principal, arr_residual = calculate_batch_schedule(*[x[index] for x in columns])
+    for n, k in enumerate(index):
+        period = max(cases[k][2], 0)
+        results[k] = schedule_to_dataframe(
+            arr_interest[n, :period], arr_principal[n, :period], arr_residual[n, :period]
+        )
+    for k in np.flatnonzero(~valid):
+        try:
+            results[k] = _single_engine(*cases[k])
+        except Exception as e:
+            results[k] = e
+    return results
+
+
+def _single_engine(*case) -> pd.DataFrame:
+    arr_interest, arr_principal, arr_residual = calculate_batch_schedule(*case)
+    return schedule_to_dataframe(arr_interest[0], arr_principal[0], arr_residual[0])
+
+
+def _stateless_engine(*case) -> pd.DataFrame:
+    return calculate_schedule(LoanTerms(*case))
+
+
+register_engine('stateless', _stateless_engine)
+register_engine('batch', _single_engine)
+register_engine('batch_vectorized', _batch_engine, batch=True)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='기준 구현 - 고속 계산 엔진 차분 검증')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    pd.set_option('display.width', 200)
+    print(run_differential(args.count, args.seed))
@@ -0,0 +1,74 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : Portfolio.py
+# Project Name : Mortgage-Loan-Calculator
+# Author       : Yogyui (SeungHee Lee)
+# Organization :
+# Description  : 대출 포트폴리오의 월별 현금흐름 집계
+# [Revision History]
+# >> 2026.10.19 - First Commit
+# -------------------------------------------------------------------------------------------------------------------- #
+import numpy as np
+import pandas as pd
+from typing import Tuple
+from BatchCalculator import iterate_batch_schedule, calculable_mask
+
+
+def aggregate_monthly_cashflow(
+        principal, interest_rate_percentage, period_month, grace_period_month, repayment_type, round_floating,
+        start_date, chunk_size: int = 1000000
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    대출 N건의 예상 상환액을 달력 월 단위로 합산
+    start_date: 대출 실행일 (datetime64 로 변환 가능한 배열), 실행월 다음 달부터 매월 상환
+    대출별 실행월 인덱스(1970년 1월 기준 개월 수)를 미리 계산해두고 회차마다 np.bincount 로 합산
+    0으로 나누기가 발생하는 대출(원리금균등 0% 금리, 대출기간 = 거치기간 등)은 합산에서 제외
+    (월별 합산 결과, 제외된 대출 인덱스) 반환
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(principal, dtype=np.int64),
+        np.asarray(interest_rate_percentage, dtype=np.float64),
+        np.asarray(period_month, dtype=np.int64),
+        np.asarray(grace_period_month, dtype=np.int64),
+        np.asarray(repayment_type, dtype=np.int64),
+        np.asarray(round_floating, dtype=np.int64),
+        np.asarray(start_date, dtype='datetime64[M]').astype(np.int64)
+    )
+    arrays = [np.atleast_1d(x) for x in arrays]
+    valid = calculable_mask(arrays[1], arrays[2], arrays[3], arrays[4])
+    excluded = np.flatnonzero(~valid)
+    principal, rate, period, grace, repayment, round_type, start_month = [x[valid] for x in arrays]
+
+    columns = ['납입월', '월상환금', '납입이자', '납입원금', '대출잔금', '상환건수']
+    if len(principal) == 0 or period.max() <= 0:
+        return pd.DataFrame(columns=columns), excluded
+    first_month = int(start_month.min()) + 1
+    month_count = int((start_month + period).max()) - first_month + 1
+    month_offset = start_month - first_month + 1  # 1회차 납입월의 ladder 인덱스
+
+    interest_sum = np.zeros(month_count, dtype=np.float64)
+    principal_sum = np.zeros(month_count, dtype=np.float64)
+    residual_sum = np.zeros(month_count, dtype=np.float64)
+    loan_count = np.zeros(month_count, dtype=np.int64)
+    for s in range(0, len(principal), chunk_size):
+        e = s + chunk_size
+        offset = month_offset[s:e]
+        for i, index, interest, repaid, residual in iterate_batch_schedule(
+                principal[s:e], rate[s:e], period[s:e], grace[s:e], repayment[s:e], round_type[s:e]):
+            index = offset[index] + i
+            interest_sum += np.bincount(index, weights=interest, minlength=month_count)
+            principal_sum += np.bincount(index, weights=repaid, minlength=month_count)
+            residual_sum += np.bincount(index, weights=residual, minlength=month_count)
+            loan_count += np.bincount(index, minlength=month_count)
+
+    # float64 합산 결과는 2^53 원 미만에서 정수 그대로 보존됨
+    interest_sum = np.round(interest_sum).astype(np.int64)
+    principal_sum = np.round(principal_sum).astype(np.int64)
+    df_result = pd.DataFrame({
+        '납입월': (np.arange(month_count) + first_month).astype('datetime64[M]').astype(str),
+        '월상환금': interest_sum + principal_sum,
+        '납입이자': interest_sum,
+        '납입원금': principal_sum,
+        '대출잔금': np.round(residual_sum).astype(np.int64),
+        '상환건수': loan_count
+    }, columns=columns)
+    return df_result, excluded
@@ -0,0 +1,144 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : Reference.py
+# Project Name : Mortgage-Loan-Calculator
+# Author       : Yogyui (SeungHee Lee)
+# Organization :
+# Description  : 상환 스케줄 기준 구현 (차분 검증용, 수정 금지)
+# [Revision History]
+# >> 2026.10.19 - First Commit
+# -------------------------------------------------------------------------------------------------------------------- #
+import math
+import numpy as np
+import pandas as pd
+from Calculator import RepaymentType, RoundType
+
+
+def reference_schedule(
+        principal: int, interest_rate_percentage: float, period_month: int, grace_period_month: int,
+        repayment_type: RepaymentType, round_floating: RoundType
+) -> pd.DataFrame:
+    """
+    MortgageLoanCalculator.calculate (2022.04.20) 반복 계산 로직을 그대로 고정한 기준 구현
+    고속 계산 엔진은 이 함수와 원 단위까지 동일한 결과(예외 포함)를 내야 함
+    출력(print) 및 설정 파일 저장만 제거, 계산 로직은 수정하지 말 것
+    대출 기간이 0 이하이면 (0으로 나누기가 먼저 발생하지 않는 한) 회차 없는 빈 DataFrame 반환
+    (원래 calculate 는 '총 납입이자' 출력에서 IndexError 가 발생했으나 출력 제거로 기준 동작은 빈 결과로 정함)
+    """
+    loan_principal = principal  # 대출 원금 (반복문의 principal 은 월 납입원금)
+    lst_sequence = []  # 납입회차
+    lst_repay_total = []  # 월 상환금
+    lst_repay_principal = []  # 월 납입원금
+    lst_repay_interest = []  # 월 납입이자
+    lst_principal_sum = []  # 납입원금 합
+    lst_interest_sum = []  # 납입이자 합
+    lst_residual = []  # 월 잔금
+
+    interest_rate_month = interest_rate_percentage / 100 / 12
+    sequence = 1  # 회차
+    residual = loan_principal  # 잔금
+    principal_sum = 0  # 원금 납입계
+    interest_sum = 0  # 이자 납입계
+
+    if repayment_type == RepaymentType.EqualPrincipalInterest:  # 원리금균등상환
+        # 월 균등 상환액 산출 (https://meaningone.tistory.com/632)
+        temp = math.pow(1 + interest_rate_month, period_month - grace_period_month)
+        repayment_month = round(loan_principal * interest_rate_month * temp / (temp - 1))  # 소수점 반올림
+        # 이터레이션
+        for i in range(period_month):
+            interest = residual * interest_rate_month
+            if round_floating == RoundType.Off:  # 반올림
+                interest = int(np.round(interest))
+            elif round_floating == RoundType.Up:  # 올림
+                interest = int(np.ceil(interest))
+            else:  # 버림
+                interest = int(np.trunc(interest))
+            interest_sum += interest
+            if i in range(grace_period_month):  # 이자거치기간일 경우
+                principal = 0
+            elif i == period_month - 1:
+                principal = residual
+                residual = 0
+            else:
+                principal = repayment_month - interest
+                residual -= principal
+            principal_sum += principal
+
+            lst_repay_interest.append(interest)
+            lst_repay_principal.append(principal)
+            lst_principal_sum.append(principal_sum)
+            lst_interest_sum.append(interest_sum)
+            lst_repay_total.append(interest + principal)
+            lst_residual.append(residual)
+            lst_sequence.append(sequence)
+            sequence += 1
+    elif repayment_type == RepaymentType.EqualPrincipal:  # 원금균등상환
+        # 이터레이션
+        principal_div = loan_principal / (period_month - grace_period_month)
+        if round_floating == RoundType.Off:  # 반올림
+            principal_div = int(np.round(principal_div))
+        elif round_floating == RoundType.Up:  # 올림
+            principal_div = int(np.ceil(principal_div))
+        else:  # 버림
+            principal_div = int(np.trunc(principal_div))
+        for i in range(period_month):
+            interest = residual * interest_rate_month
+            if round_floating == RoundType.Off:  # 반올림
+                interest = int(np.round(interest))
+            elif round_floating == RoundType.Up:  # 올림
+                interest = int(np.ceil(interest))
+            else:  # 버림
+                interest = int(np.trunc(interest))
+            interest_sum += interest
+            if i in range(grace_period_month):  # 이자거치기간일 경우
+                principal = 0
+            elif i == period_month - 1:
+                principal = residual
+                residual = 0
+            else:
+                principal = principal_div
+                residual -= principal
+            principal_sum += principal
+
+            lst_repay_interest.append(interest)
+            lst_repay_principal.append(principal)
+            lst_principal_sum.append(principal_sum)
+            lst_interest_sum.append(interest_sum)
+            lst_repay_total.append(interest + principal)
+            lst_residual.append(residual)
+            lst_sequence.append(sequence)
+            sequence += 1
+    elif repayment_type == RepaymentType.Bullet:  # 만기일시상환
+        # 이터레이션
+        interest = residual * interest_rate_month
+        if round_floating == RoundType.Off:  # 반올림
+            interest = int(np.round(interest))
+        elif round_floating == RoundType.Up:  # 올림
+            interest = int(np.ceil(interest))
+        else:  # 버림
+            interest = int(np.trunc(interest))
+        for i in range(period_month):
+            interest_sum += interest
+            if i == period_month - 1:
+                principal = residual
+                residual = 0
+            else:
+                principal = 0
+                residual -= principal
+            principal_sum += principal
+
+            lst_repay_interest.append(interest)
+            lst_repay_principal.append(principal)
+            lst_principal_sum.append(principal_sum)
+            lst_interest_sum.append(interest_sum)
+            lst_repay_total.append(interest + principal)
+            lst_residual.append(residual)
+            lst_sequence.append(sequence)
+            sequence += 1
+
+    df_result = pd.DataFrame(
+        (lst_sequence, lst_repay_total,
+         lst_repay_interest, lst_interest_sum,
+         lst_repay_principal, lst_principal_sum, lst_residual)
+    ).T
+    df_result.columns = ['납입회차', '월상환금', '납입이자', '납입이자계', '납입원금', '납입원금계', '대출잔금']
+    return df_result
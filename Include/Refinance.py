@@ -0,0 +1,88 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : Refinance.py
+# Project Name : Mortgage-Loan-Calculator
+# Author       : Yogyui (SeungHee Lee)
+# Organization :
+# Description  : 대환대출(갈아타기) 손익분기 분석
+# [Revision History]
+# >> 2026.10.19 - First Commit
+# -------------------------------------------------------------------------------------------------------------------- #
+import numpy as np
+import pandas as pd
+from Calculator import LoanTerms
+from BatchCalculator import calculate_batch_schedule, calculable_mask
+
+
+def analyze_refinance(current: LoanTerms, month: int, offers: pd.DataFrame) -> pd.DataFrame:
+    """
+    기존 대출을 month 회차 납입 후 대환하는 경우 대환 조건(offers)별 손익분기 회차 및 총 절감액 계산
+    offers 컬럼: interest (연이자율 %), period (대출기간), repayment (상환방식),
+                 round_float (소수점 처리, 생략 시 기존 대출과 동일), grace (거치기간, 생략 시 0), fee (대환 비용, 생략 시 0)
+    기존 대출의 month 회차 잔금을 모든 대환 조건의 원금으로 하여 한번에 계산하고,
+    대환 시점 이후 누적 지출(대환 비용 + 월상환금)이 기존 대출의 누적 지출 이하로 내려간 뒤 끝까지 유지되기 시작하는
+    회차를 손익분기 회차로 반환 (대환 후 1회차부터, 최종 절감액이 음수이면 NA / 계산 불가능한 조건은 모든 결과값 NA)
+    """
+    if not 0 <= month < current.period_month:
+        raise ValueError('month must be in [0, {})'.format(current.period_month))
+
+    # 기존 대출: month 회차 잔금 및 이후 월상환금
+    cur_interest, cur_principal, cur_residual = calculate_batch_schedule(
+        current.principal, current.interest_rate_percentage, current.period_month, current.grace_period_month,
+        current.repayment_type, current.round_floating
+    )
+    residual = current.principal if month == 0 else int(cur_residual[0, month - 1])
+    cur_repayment = (cur_interest + cur_principal)[0, month:]
+
+    count = len(offers)
+    rate = offers['interest'].to_numpy(dtype=np.float64)
+    period = offers['period'].to_numpy(dtype=np.int64)
+    repayment = offers['repayment'].to_numpy(dtype=np.int64)
+    round_type = _column(offers, 'round_float', int(current.round_floating), np.int64)
+    grace = _column(offers, 'grace', 0, np.int64)
+    fee = _column(offers, 'fee', 0, np.int64)
+    valid = calculable_mask(rate, period, grace, repayment) & (period > 0)
+
+    # 대환 조건 전체를 (N, 기간) 배열로 한번에 계산
+    index = np.flatnonzero(valid)
+    off_interest, off_principal, _ = calculate_batch_schedule(
+        residual, rate[index], period[index], grace[index], repayment[index], round_type[index]
+    )
+    horizon = max(len(cur_repayment), off_interest.shape[1])
+    cur_cost = np.cumsum(np.pad(cur_repayment, (0, horizon - len(cur_repayment))))
+    off_repayment = np.pad(off_interest + off_principal, ((0, 0), (0, horizon - off_interest.shape[1])))
+    off_cost = fee[index, np.newaxis] + np.cumsum(off_repayment, axis=1)
+    savings = cur_cost[np.newaxis, :] - off_cost  # 대환 후 t+1 회차까지의 누적 절감액
+
+    # 마지막으로 누적 절감액이 음수인 회차의 다음 회차 (이후로는 계속 절감, 최종 절감액이 음수이면 NA)
+    negative = savings < 0
+    last_negative = np.where(negative.any(axis=1), horizon - 1 - negative[:, ::-1].argmax(axis=1), -1)
+    has_break_even = ~negative[:, -1]
+    break_even = _masked(count, index[has_break_even], last_negative[has_break_even] + 2)
+    lifetime_savings = _masked(count, index, savings[:, -1])
+    total_interest = _masked(count, index, off_interest.sum(axis=1))
+    first_repayment = _masked(count, index, off_repayment[:, 0])
+
+    df_result = pd.DataFrame({
+        '대환원금': np.full(count, residual, dtype=np.int64),
+        '첫회상환금': first_repayment,
+        '총납입이자': total_interest,
+        '대환비용': fee,
+        '손익분기회차': break_even,
+        '총절감액': lifetime_savings
+    }, index=offers.index)
+    return df_result
+
+
+def _column(offers: pd.DataFrame, name: str, default, dtype) -> np.ndarray:
+    if name in offers.columns:
+        return offers[name].to_numpy(dtype=dtype)
+    return np.full(len(offers), default, dtype=dtype)
+
+
+def _masked(count: int, index: np.ndarray, values: np.ndarray) -> pd.arrays.IntegerArray:
+    # index 위치에만 값을 채우고 나머지는 NA
+    result = np.zeros(count, dtype=np.int64)
+    result[index] = values
+    mask = np.ones(count, dtype=bool)
+    mask[index] = False
+    return pd.arrays.IntegerArray(result, mask)
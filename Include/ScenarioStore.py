@@ -0,0 +1,268 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : ScenarioStore.py
+# Project Name : Mortgage-Loan-Calculator
+# Author       : Yogyui (SeungHee Lee)
+# Organization :
+# Description  : 계산 조건(시나리오) 및 계산 결과 요약 저장소 (SQLite)
+# [Revision History]
+# >> 2026.10.19 - First Commit
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import datetime
+import sqlite3
+import numpy as np
+import pandas as pd
+from typing import Iterable, List, Union
+import xml.etree.ElementTree as ET
+from Common import ensurePathExist
+from Calculator import MortgageLoanCalculator, RepaymentType, RoundType
+from BatchCalculator import iterate_batch_schedule, calculable_mask
+
+# 시나리오 입력 항목 (config.xml 태그명과 동일)
+PARAM_KEYS = ['principal', 'interest', 'period', 'grace', 'repayment', 'round_float', 'start_date', 'payment_day']
+# 계산 결과 요약 항목
+SUMMARY_KEYS = ['first_repayment', 'max_repayment', 'total_interest', 'total_principal']
+
+
+def calculator_params(calculator: MortgageLoanCalculator) -> dict:
+    # 계산기의 현재 조건을 시나리오 입력 형식으로 변환
+    return {
+        'principal': calculator.principal,
+        'interest': calculator.interest_rate_percentage,
+        'period': calculator.period_month,
+        'grace': calculator.grace_period_month,
+        'repayment': calculator.repayment_type.value,
+        'round_float': calculator.round_floating.value,
+        'start_date': calculator.start_date.isoformat(),
+        'payment_day': calculator.payment_day
+    }
+
+
+def summarize_scenarios(params: List[dict]) -> List[dict]:
+    """
+    시나리오 N건의 계산 결과 요약 (첫회 상환금, 최대 월상환금, 총 납입이자, 총 납입원금)
+    계산이 불가능한 조건 (원금균등/원리금균등에서 대출기간 = 거치기간 등)은 요약값 None
+    """
+    result = [dict.fromkeys(SUMMARY_KEYS) for _ in params]
+    columns = [np.array([x[key] for x in params]) for key in PARAM_KEYS[:6]]
+    valid = calculable_mask(columns[1], columns[2], columns[3], columns[4]) & (columns[2] > 0)
+    if not valid.any():
+        return result
+    columns = [x[valid] for x in columns]
+    count = int(valid.sum())
+    first_repayment = np.zeros(count, dtype=np.int64)
+    max_repayment = np.full(count, np.iinfo(np.int64).min, dtype=np.int64)
+    total_interest = np.zeros(count, dtype=np.int64)
+    total_principal = np.zeros(count, dtype=np.int64)
+    for i, index, interest, repaid, _ in iterate_batch_schedule(*columns):
+        repayment = interest + repaid
+        if i == 0:
+            first_repayment[index] = repayment
+        max_repayment[index] = np.maximum(max_repayment[index], repayment)
+        total_interest[index] += interest
+        total_principal[index] += repaid
+    for n, k in enumerate(np.flatnonzero(valid)):
+        result[k] = {
+            'first_repayment': int(first_repayment[n]),
+            'max_repayment': int(max_repayment[n]),
+            'total_interest': int(total_interest[n]),
+            'total_principal': int(total_principal[n])
+        }
+    return result
+
+
+class ScenarioStore:
+    def __init__(self, db_path: str = None):
+        curpath = os.path.dirname(os.path.abspath(__file__))
+        import_config = db_path is None
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(curpath), 'Config/scenario.db')
+        self._db_path = db_path
+        self._config_xml_path = os.path.join(os.path.dirname(curpath), 'Config/config.xml')
+        created = db_path == ':memory:' or not os.path.isfile(db_path)
+        if db_path != ':memory:':
+            ensurePathExist(os.path.dirname(os.path.abspath(db_path)))
+        self._conn = sqlite3.connect(db_path)
+        self._conn.row_factory = sqlite3.Row
+        self.initTables()
+        if import_config and created:  # 기본 저장소 최초 생성 시 기존 설정 파일 가져오기
+            self.importConfigXml()
+
+    def initTables(self):
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS scenario (
+                    id INTEGER PRIMARY KEY,
+                    customer TEXT NOT NULL DEFAULT '',
+                    name TEXT NOT NULL DEFAULT '',
+                    created TEXT NOT NULL,
+                    principal INTEGER NOT NULL,
+                    interest REAL NOT NULL,
+                    period INTEGER NOT NULL,
+                    grace INTEGER NOT NULL,
+                    repayment INTEGER NOT NULL,
+                    round_float INTEGER NOT NULL,
+                    start_date TEXT,
+                    payment_day INTEGER,
+                    first_repayment INTEGER,
+                    max_repayment INTEGER,
+                    total_interest INTEGER,
+                    total_principal INTEGER
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS scenario_tag (
+                    tag TEXT NOT NULL,
+                    scenario_id INTEGER NOT NULL REFERENCES scenario(id) ON DELETE CASCADE,
+                    PRIMARY KEY (tag, scenario_id)
+                ) WITHOUT ROWID""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_scenario_customer ON scenario(customer, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_scenario_tag_id ON scenario_tag(scenario_id)")
+
+    def close(self):
+        self._conn.close()
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM scenario").fetchone()[0]
+
+    def addScenario(self, params: dict, customer: str = '', name: str = '', tags: Iterable[str] = ()) -> int:
+        record = dict(params, customer=customer, name=name, tags=list(tags))
+        return self.addScenarios([record])[0]
+
+    def addScenarios(self, records: Iterable[dict]) -> List[int]:
+        """
+        시나리오 일괄 저장 (한 트랜잭션), 저장된 시나리오 id 목록 반환
+        record: PARAM_KEYS 항목 + customer, name, tags (선택)
+        상환방식/소수점 처리 값이 올바르지 않으면 ValueError (아무것도 저장하지 않음)
+        계산 결과 요약은 저장 시점에 일괄 계산하여 함께 저장
+        """
+        records = list(records)
+        if len(records) == 0:
+            return []
+        params = [self._normalizeParams(x) for x in records]
+        summaries = summarize_scenarios(params)
+        created = datetime.datetime.now().isoformat(timespec='seconds')
+        with self._conn:
+            # 쓰기 잠금을 먼저 잡은 뒤 id 할당 (다른 연결과 동시에 저장해도 id 충돌 없음)
+            self._conn.execute("BEGIN IMMEDIATE")
+            base = self._conn.execute("SELECT IFNULL(MAX(id), 0) FROM scenario").fetchone()[0]
+            ids = list(range(base + 1, base + 1 + len(records)))
+            columns = ['id', 'customer', 'name', 'created'] + PARAM_KEYS + SUMMARY_KEYS
+            rows = [
+                [ids[n], str(x.get('customer', '')), str(x.get('name', '')), created] +
+                [params[n][key] for key in PARAM_KEYS] + [summaries[n][key] for key in SUMMARY_KEYS]
+                for n, x in enumerate(records)
+            ]
+            self._conn.executemany(
+                "INSERT INTO scenario ({}) VALUES ({})".format(', '.join(columns), ', '.join('?' * len(columns))),
+                rows
+            )
+            tag_rows = [(str(tag), ids[n]) for n, x in enumerate(records) for tag in set(x.get('tags', ()))]
+            self._conn.executemany("INSERT INTO scenario_tag (tag, scenario_id) VALUES (?, ?)", tag_rows)
+        return ids
+
+    def getScenario(self, scenario_id: int) -> Union[dict, None]:
+        row = self._conn.execute("SELECT * FROM scenario WHERE id = ?", (scenario_id, )).fetchone()
+        if row is None:
+            return None
+        result = dict(row)
+        tags = self._conn.execute("SELECT tag FROM scenario_tag WHERE scenario_id = ? ORDER BY tag", (scenario_id, ))
+        result['tags'] = [x[0] for x in tags]
+        return result
+
+    def listScenarios(
+            self, customer: str = None, tag: str = None, limit: int = None, offset: int = 0
+    ) -> pd.DataFrame:
+        # 고객/태그 인덱스로 조회, 저장된 요약값을 그대로 반환 (재계산 없음)
+        sql = "SELECT s.* FROM scenario s"
+        conditions, args = [], []
+        if tag is not None:
+            sql += " JOIN scenario_tag t ON t.scenario_id = s.id"
+            conditions.append("t.tag = ?")
+            args.append(tag)
+        if customer is not None:
+            conditions.append("s.customer = ?")
+            args.append(customer)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY s.id LIMIT ? OFFSET ?"
+        args.extend([-1 if limit is None else limit, offset])
+        return pd.read_sql_query(sql, self._conn, params=args)
+
+    def deleteScenario(self, scenario_id: int):
+        with self._conn:
+            self._conn.execute("DELETE FROM scenario_tag WHERE scenario_id = ?", (scenario_id, ))
+            self._conn.execute("DELETE FROM scenario WHERE id = ?", (scenario_id, ))
+
+    def applyScenario(self, scenario_id: int, calculator: MortgageLoanCalculator) -> bool:
+        # 저장된 시나리오 조건을 계산기에 적용
+        scenario = self.getScenario(scenario_id)
+        if scenario is None:
+            return False
+        calculator.principal = scenario['principal']
+        calculator.interest_rate_percentage = scenario['interest']
+        calculator.period_month = scenario['period']
+        calculator.grace_period_month = scenario['grace']
+        calculator.repayment_type = RepaymentType(scenario['repayment'])
+        calculator.round_floating = RoundType(scenario['round_float'])
+        if scenario['start_date'] is not None:
+            calculator.start_date = datetime.date.fromisoformat(scenario['start_date'])
+        if scenario['payment_day'] is not None:
+            calculator.payment_day = scenario['payment_day']
+        return True
+
+    def importConfigXml(
+            self, path: str = None, customer: str = '', name: str = 'config.xml', tags: Iterable[str] = ('imported', )
+    ) -> Union[int, None]:
+        # 기존 설정 파일(config.xml)의 조건을 시나리오로 저장
+        if path is None:
+            path = self._config_xml_path
+        if not os.path.isfile(path):
+            return None
+        try:
+            root = ET.parse(path).getroot()
+        except ET.ParseError:
+            return None
+        params = {}
+        for key in PARAM_KEYS:
+            node = root.find(key)
+            if node is not None and node.text is not None:
+                params[key] = node.text
+        if not all(key in params for key in PARAM_KEYS[:3]):
+            return None
+        # loadConfig 와 마찬가지로 올바르지 않은 값은 무시 (기본값 사용)
+        for key in ['repayment', 'round_float', 'start_date', 'payment_day']:
+            if key not in params:
+                continue
+            try:
+                if key == 'repayment':
+                    RepaymentType(int(params[key]))
+                elif key == 'round_float':
+                    RoundType(int(params[key]))
+                elif key == 'start_date':
+                    datetime.date.fromisoformat(params[key])
+                elif not 1 <= int(params[key]) <= 31:
+                    del params[key]
+            except ValueError:
+                del params[key]
+        try:
+            return self.addScenario(params, customer=customer, name=name, tags=tags)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _normalizeParams(record: dict) -> dict:
+        params = {
+            'principal': int(record['principal']),
+            'interest': float(record['interest']),
+            'period': int(record['period']),
+            'grace': int(record.get('grace', 0)),
+            'repayment': RepaymentType(int(record.get('repayment', RepaymentType.EqualPrincipalInterest))).value,
+            'round_float': RoundType(int(record.get('round_float', RoundType.Off))).value,
+            'start_date': record.get('start_date'),
+            'payment_day': record.get('payment_day')
+        }
+        if isinstance(params['start_date'], datetime.date):
+            params['start_date'] = params['start_date'].isoformat()
+        if params['payment_day'] is not None:
+            params['payment_day'] = int(params['payment_day'])
+        return params